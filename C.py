@@ -5,6 +5,7 @@ import cmd
 from models.base_model import BaseModel
 from models import storage
 import re
+import sys
 import json
 
 
@@ -127,13 +128,38 @@ class HBNBCommand(cmd.Cmd):
 
     def do_all(self, line):
         """Prints all string representation of all instances."""
-        if line:
-            if line not in storage.classes():
-                print("** class doesn't exist **")
-            else:
-                print([str(obj) for obj in storage.all().values() if obj.__class__.__name__ == line])
+        words = line.split()
+        as_json = "--json" in words
+        line = " ".join(word for word in words if word != "--json")
+
+        if line and line not in storage.classes():
+            print("** class doesn't exist **")
+            return
+
+        objs = (obj for obj in storage.all().values()
+                if not line or obj.__class__.__name__ == line)
+        if as_json:
+            self._write_ndjson(objs)
         else:
-            print([str(obj) for obj in storage.all().values()])
+            self._write_list(objs)
+
+    def _write_list(self, objs):
+        """Streams objects in the same format as print([str(obj), ...])."""
+        out = sys.stdout
+        out.write("[")
+        sep = ""
+        for obj in objs:
+            out.write(sep)
+            out.write(repr(str(obj)))
+            sep = ", "
+        out.write("]\n")
+
+    def _write_ndjson(self, objs):
+        """Streams objects as newline-delimited JSON of their to_dict()."""
+        out = sys.stdout
+        for obj in objs:
+            out.write(json.dumps(obj.to_dict()))
+            out.write("\n")
 
     def do_count(self, line):
         """Counts the instances of a class."""
@@ -13,6 +13,7 @@ Unittest classes:
 """
 import os
 import sys
+import json
 import unittest
 from models import storage
 from models.engine.file_storage import FileStorage
@@ -851,6 +852,32 @@ class TestHBNBCommand_all(unittest.TestCase):
             self.assertIn("Review", output.getvalue().strip())
             self.assertNotIn("BaseModel", output.getvalue().strip())
 
+    def test_all_output_matches_list_repr(self):
+        with patch("sys.stdout", new=StringIO()) as output:
+            self.assertFalse(HBNBCommand().onecmd("create User"))
+            self.assertFalse(HBNBCommand().onecmd("create State"))
+        correct = str([str(obj) for obj in storage.all().values()])
+        with patch("sys.stdout", new=StringIO()) as output:
+            self.assertFalse(HBNBCommand().onecmd("all"))
+            self.assertEqual(correct, output.getvalue().strip())
+
+    def test_all_json_lines(self):
+        with patch("sys.stdout", new=StringIO()) as output:
+            self.assertFalse(HBNBCommand().onecmd("create User"))
+            testID = output.getvalue().strip()
+        with patch("sys.stdout", new=StringIO()) as output:
+            self.assertFalse(HBNBCommand().onecmd("all User --json"))
+            lines = output.getvalue().splitlines()
+            dicts = [json.loads(line) for line in lines]
+            self.assertIn(testID, [d["id"] for d in dicts])
+            self.assertTrue(all(d["__class__"] == "User" for d in dicts))
+
+    def test_all_json_invalid_class(self):
+        correct = "** class doesn't exist **"
+        with patch("sys.stdout", new=StringIO()) as output:
+            self.assertFalse(HBNBCommand().onecmd("all MyModel --json"))
+            self.assertEqual(correct, output.getvalue().strip())
+
 
 class TestHBNBCommand_update(unittest.TestCase):
     """Unittests for testing update from the HBNB command interpreter."""